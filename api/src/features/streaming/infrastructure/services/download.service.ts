@@ -15,6 +15,10 @@ import {
   TRACK_REPOSITORY,
 } from '@features/tracks/domain/ports/track-repository.port';
 
+// Mismo tamaño que el highWaterMark del archive: lecturas de 1 MiB en vez de
+// los 64 KiB por defecto reducen las syscalls en descargas de álbumes grandes.
+const ZIP_READ_CHUNK_SIZE = 1024 * 1024;
+
 export interface AlbumDownloadInfo {
   albumId: string;
   albumName: string;
@@ -77,7 +81,7 @@ export class DownloadService {
     // comprimir de nuevo solo desperdicia CPU sin reducir tamaño.
     const archive = archiver('zip', {
       zlib: { level: 0 },
-      highWaterMark: 1024 * 1024,
+      highWaterMark: ZIP_READ_CHUNK_SIZE,
     });
 
     let aborted = false;
@@ -167,7 +171,12 @@ export class DownloadService {
       const ext = track.suffix || path.extname(safePath).slice(1) || 'mp3';
       const fileName = `${discPrefix}${trackNum} - ${safeTitle}.${ext}`;
 
-      const fileStream = this.filesystemService.createReadStream(safePath);
+      const fileStream = this.filesystemService.createReadStream(
+        safePath,
+        undefined,
+        undefined,
+        ZIP_READ_CHUNK_SIZE
+      );
 
       archive.append(fileStream, {
         name: `${folderName}/${fileName}`,
@@ -272,6 +272,20 @@ describe('FilesystemService', () => {
       });
     });
 
+    it('should pass highWaterMark when provided', () => {
+      const mockStream = { pipe: jest.fn() };
+      (fs.createReadStream as jest.Mock).mockReturnValue(mockStream);
+
+      const filePath = p('/music', 'file.mp3');
+      service.createReadStream(filePath, undefined, undefined, 1024 * 1024);
+
+      expect(fs.createReadStream).toHaveBeenCalledWith(filePath, {
+        start: undefined,
+        end: undefined,
+        highWaterMark: 1024 * 1024,
+      });
+    });
+
     it('should reject path traversal in createReadStream', () => {
       expect(() => service.createReadStream('/etc/passwd')).toThrow(ForbiddenException);
     });
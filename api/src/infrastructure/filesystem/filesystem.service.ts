@@ -171,9 +171,13 @@ export class FilesystemService implements OnModuleInit {
     return fs.promises.stat(filePath);
   }
 
-  createReadStream(filePath: string, start?: number, end?: number) {
+  createReadStream(filePath: string, start?: number, end?: number, highWaterMark?: number) {
     this.assertSafePath(filePath);
-    return fs.createReadStream(filePath, { start, end });
+    return fs.createReadStream(filePath, {
+      start,
+      end,
+      ...(highWaterMark !== undefined && { highWaterMark }),
+    });
   }
 
   getUploadPath(): string {